@@ -1,6 +1,7 @@
 import argparse
 import secrets
 import string
+import sys
 
 
 def build_parser():
@@ -11,39 +12,135 @@ def build_parser():
     return p
 
 
-def generate_password(length: int, use_symbols: bool) -> str:
-    lowers = string.ascii_lowercase
-    uppers = string.ascii_uppercase
-    digits = string.digits
-    symbols = "!@#$%^&*()-_=+[]{};:,.?/"
+def make_table(alphabet: str) -> tuple[bytes, bytes]:
+    """
+    Build the bytes.translate arguments that map a random byte onto alphabet.
+
+    Returns (table, rejected): table maps byte b to alphabet[b % size], and
+    rejected lists the bytes >= limit, which are dropped so every character
+    is equally likely (no modulo bias).
+    """
+    size = len(alphabet)
+    limit = 256 - (256 % size)
+    table = bytes(ord(alphabet[b % size]) for b in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+
+# Alphabets and their translate tables are fixed, so build them once.
+LOWERS = string.ascii_lowercase
+UPPERS = string.ascii_uppercase
+DIGITS = string.digits
+SYMBOLS = "!@#$%^&*()-_=+[]{};:,.?/"
+
+# one required pick per class, then the rest from the pool
+CLASSES_SYMBOLS = tuple(make_table(a) for a in (LOWERS, UPPERS, DIGITS, SYMBOLS))
+CLASSES_NOSYM = CLASSES_SYMBOLS[:3]
+POOL_SYMBOLS = make_table(LOWERS + UPPERS + DIGITS + SYMBOLS)
+POOL_NOSYM = make_table(LOWERS + UPPERS + DIGITS)
+
+# how many passwords to collect before each write to stdout
+WRITE_BATCH = 1024
+
+
+def sample(alphabet: tuple[bytes, bytes], n: int) -> bytes:
+    """
+    Return n ASCII bytes drawn uniformly from a make_table() alphabet.
+
+    Draws random bytes in bulk with one token_bytes call and maps them with
+    bytes.translate (in C), instead of one secrets.choice call per character.
+    """
+    table, rejected = alphabet
+
+    out = b""
+    while len(out) < n:
+        # 2x oversample so a top-up is rarely needed
+        raw = secrets.token_bytes((n - len(out)) * 2)
+        out += raw.translate(table, rejected)
+    return out[:n]
+
+
+def sample_each(alphabets: tuple[tuple[bytes, bytes], ...]) -> bytes:
+    """
+    Return one ASCII byte drawn uniformly from each make_table() alphabet.
+
+    All picks come from one token_bytes call (2 bytes per alphabet). A
+    rejected byte just moves on to the next one, with a top-up draw in the
+    rare case the buffer runs out.
+    """
+    out = bytearray()
+    raw = secrets.token_bytes(len(alphabets) * 2)
+    pos = 0
+
+    for table, rejected in alphabets:
+        limit = 256 - len(rejected)
+        while True:
+            if pos == len(raw):
+                raw = secrets.token_bytes(len(alphabets) * 2)
+                pos = 0
+            b = raw[pos]
+            pos += 1
+            if b < limit:
+                out.append(table[b])
+                break
+
+    return bytes(out)
+
+
+def shuffle(buf: bytearray) -> None:
+    """
+    Fisher-Yates shuffle buf in place using one token_bytes draw.
+
+    Each swap uses a 4-byte random int, so the modulo bias is at most
+    len(buf) / 2**32, which is negligible for password lengths.
+    """
+    rnd = memoryview(secrets.token_bytes(len(buf) * 4)).cast("I")
+    for i in range(len(buf) - 1, 0, -1):
+        j = rnd[i] % (i + 1)
+        buf[i], buf[j] = buf[j], buf[i]
+
+
+def make_generator(length: int, use_symbols: bool):
+    """
+    Return a no-argument function that generates one password per call.
+
+    Everything that only depends on (length, use_symbols) — the alphabets,
+    the length check, how many characters to fill — is worked out once
+    here, so each call only draws randomness and builds the string. The
+    random draws all go through sample_each(), sample() and shuffle().
+    """
+    if use_symbols:
+        classes, pool = CLASSES_SYMBOLS, POOL_SYMBOLS
+    else:
+        classes, pool = CLASSES_NOSYM, POOL_NOSYM
 
-    min_length = 4 if use_symbols else 3
+    min_length = len(classes)
     if length < min_length:
         raise ValueError(f"Password length must be at least {min_length}")
 
-    chars = []
-    chars.append(secrets.choice(lowers))
-    chars.append(secrets.choice(uppers))
-    chars.append(secrets.choice(digits))
-    if use_symbols:
-        chars.append(secrets.choice(symbols))
+    fill = length - min_length
 
-    # 4) fill remaining characters from allowed pool
-    # (you implement)
-    pool = lowers + uppers + digits
-    if use_symbols:
-        pool += symbols
+    def generate() -> str:
+        # one flat buffer, written in place
+        chars = bytearray(length)
+
+        # one required pick per character class, at the front for now
+        chars[:min_length] = sample_each(classes)
 
-    while len(chars) < length:
-        chars.append(secrets.choice(pool))
+        # fill remaining characters from allowed pool
+        chars[min_length:] = sample(pool, fill)
 
-    # 5) shuffle to remove predictability
-    # (you implement)
-    secrets.SystemRandom().shuffle(chars)
+        # shuffle to remove predictability, which also moves the required
+        # picks to random positions
+        shuffle(chars)
 
-    # 6) return as string
-    # (you implement)
-    return "".join(chars)
+        return chars.decode("ascii")
+
+    return generate
+
+
+def generate_password(length: int, use_symbols: bool) -> str:
+    return make_generator(length, use_symbols)()
 
 
 def main(argv=None):
@@ -57,11 +154,15 @@ def main(argv=None):
         raise SystemExit("ERROR: --count must be a positive integer")
 
     try:
-        for _ in range(args.count):
-            print(generate_password(args.length, use_symbols))
+        gen = make_generator(args.length, use_symbols)
     except ValueError as e:
         raise SystemExit(f"ERROR: {e}")
 
+    # write passwords in batches instead of one print() per password
+    for start in range(0, args.count, WRITE_BATCH):
+        batch = [gen() for _ in range(min(WRITE_BATCH, args.count - start))]
+        sys.stdout.write("\n".join(batch) + "\n")
+
 
 
 if __name__ == "__main__":
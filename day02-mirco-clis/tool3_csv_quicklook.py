@@ -1,7 +1,24 @@
 import argparse
+import array
 import csv
+import os
+import re
+import sys
 from pathlib import Path
 
+# Files at least this big are scanned with pyarrow when it's installed;
+# below that the csv module is fast enough and starts up quicker. pyarrow
+# is only imported for those files, since importing it costs ~100 ms.
+ARROW_MIN_BYTES = 16 << 20
+
+# 1 MiB read buffer (the default is 8 KiB), so far fewer read() calls
+READ_BUFFER_SIZE = 1 << 20
+
+# The forms float() accepts, matched without raising an exception:
+# decimals/exponents, and inf/infinity/nan (any case, optional sign).
+NUMBER_RE = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+SPECIAL_NUMBER_RE = re.compile(r"\s*[+-]?(?:inf|infinity|nan)\s*", re.IGNORECASE)
+
 
 def build_parser() -> argparse.ArgumentParser:
     """
@@ -9,7 +26,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     You should understand:
     - positional arguments (csv_path)
-    - optional arguments (--head, --delimiter)
+    - optional arguments (--head, --delimiter, --preview-only)
     - default values and type=int
     """
     parser = argparse.ArgumentParser(
@@ -18,6 +35,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("csv_path", help="Path to the CSV file")
     parser.add_argument("--head", type=int, default=5, help="How many rows to preview (default: 5)")
     parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
+    parser.add_argument(
+        "--preview-only",
+        action="store_true",
+        help="Only print the columns and first --head rows; stop reading there (no stats)",
+    )
     return parser
 
 
@@ -28,8 +50,10 @@ def is_missing(value: str) -> bool:
     Definition for this project:
     - missing if the value is empty after stripping whitespace
       Examples: "" -> missing, "   " -> missing
+
+    Same result as value.strip() == "" without allocating a stripped copy.
     """
-    return value.strip() == ""
+    return not value or value.isspace()
 
 
 def is_number(value: str) -> bool:
@@ -39,7 +63,15 @@ def is_number(value: str) -> bool:
     For this tool:
     - Treat numeric if float(value) works.
     - If float(...) raises ValueError, it's not numeric.
+
+    Most text cells would make float() raise, and raising is slow, so the
+    common forms are checked with precompiled regexes first. float() is only
+    tried for the rare digit-group form ("1_000") the regexes don't cover.
     """
+    if NUMBER_RE.fullmatch(value) or SPECIAL_NUMBER_RE.fullmatch(value):
+        return True
+    if "_" not in value:
+        return False
     try:
         float(value)
         return True
@@ -47,79 +79,254 @@ def is_number(value: str) -> bool:
         return False
 
 
-def main(argv=None) -> None:
-    args = build_parser().parse_args(argv)
+def read_header(reader) -> list[str]:
+    """Return the header row from a csv.reader, or exit if the file has none."""
+    columns = next(reader, None)
+    if columns is None:
+        raise SystemExit("ERROR: Could not read header row (no columns found).")
+    return columns
 
-    # ===== Step 1: Validate arguments =====
-    # TODO: validate args.head is >= 0
-    # If invalid, exit nicely like:
-    #   raise SystemExit("ERROR: --head must be >= 0")
 
-    if args.head < 0:
-        raise SystemExit("ERROR: --head must be >= 0")
+def read_preview(path: Path, delimiter: str, head: int):
+    """
+    Read just the header and the first head rows, then stop.
 
+    Returns (columns, preview_rows). Runtime depends on head, not file size.
+    """
+    preview_rows: list[list[str]] = []
 
-    # ===== Step 2: Validate file path =====
-    path = Path(args.csv_path)
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        columns = read_header(reader)
+
+        # check the limit before parsing another row, so nothing past the
+        # window is read (and --head 0 reads no data rows at all)
+        while len(preview_rows) < head:
+            row = next(reader, None)
+            if row is None:
+                break
+            # skip blank lines, like the full scan does
+            if row:
+                preview_rows.append(row)
 
-    # TODO: check file exists, else SystemExit with a helpful error
-    # TODO: check it's a file (not a folder), else SystemExit
+    return columns, preview_rows
 
-    if not path.exists():
-        raise SystemExit(f"ERROR: file not found: {path}")
 
-    if not path.is_file():
-        raise SystemExit(f"ERROR: not a file: {path}")
+def row_as_dict(columns: list[str], row: list[str]) -> dict:
+    """
+    Turn a raw row into the dict csv.DictReader would have produced:
+    missing trailing columns are None, extra cells go in a list under None.
+    """
+    d = dict(zip(columns, row))
+    if len(row) < len(columns):
+        for c in columns[len(row):]:
+            d[c] = None
+    elif len(row) > len(columns):
+        d[None] = row[len(columns):]
+    return d
+
+
+def format_preview(columns: list[str], preview_rows: list[list[str]], head: int) -> list[str]:
+    """Return the output lines for the row preview."""
+    out = [f"Preview (first {min(head, len(preview_rows))} rows):"]
+    for i, row in enumerate(preview_rows, start=1):
+        out.append(f"{i}. {row_as_dict(columns, row)}")
+    return out
+
 
+def scan_with_csv(path: Path, delimiter: str, head: int):
+    """
+    Scan the whole file with the csv module.
 
+    Returns (columns, row_count, missing_counts, non_missing_seen,
+    numeric_possible, preview_rows).
+    """
     row_count = 0
-    preview_rows = []
+    preview_rows: list[list[str]] = []   # raw rows; turned into dicts only when printed
+    preview_limit = head
 
-    with path.open("r", encoding="utf-8", newline="") as f:
+    with path.open("r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE) as f:
         # what does the "r" mean here?
-        reader = csv.DictReader(f, delimiter=args.delimiter)
+        # we read front to back, so let the kernel read ahead aggressively
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-        if reader.fieldnames is None:
-            raise SystemExit("ERROR: Could not read header row (no columns found).")
+        # csv.reader yields plain lists, so there's no dict built per row
+        # and no dict lookup per cell; columns are indexed by position
+        reader = csv.reader(f, delimiter=delimiter)
 
-        columns = reader.fieldnames
+        columns = read_header(reader)
+        ncols = len(columns)
 
-        # Initialize stats dicts
-        missing_counts = {c: 0 for c in columns}
-        numeric_possible = {c: True for c in columns}   # stays True only if all non-missing values are numeric
-        non_missing_seen = {c: 0 for c in columns}
-        # why do we need the numeric_possible and non_missing_seen dicts?
-        # explain how {c: 0 for c in columns} works
+        # Initialize stats arrays (one slot per column, same order as columns).
+        # array.array / bytearray keep each statistic in one flat, contiguous
+        # buffer of machine ints instead of a list of pointers to int objects.
+        missing_counts = array.array("q", [0] * ncols)
+        numeric_possible = bytearray(b"\x01" * ncols)   # stays 1 only if all non-missing values are numeric
+        non_missing_seen = array.array("q", [0] * ncols)
+        # why do we need the numeric_possible and non_missing_seen arrays?
+
+        # columns that could still be numeric; once one fails it drops out and
+        # no more number parsing is done for it
+        active_numeric = list(range(ncols))
 
         for row in reader:
+            # DictReader skipped blank lines; keep that behaviour
+            if not row:
+                continue
             row_count += 1
 
             # preview rows
-            if len(preview_rows) < args.head:
+            if row_count <= preview_limit:
                 preview_rows.append(row)
 
+            # short rows are missing their trailing cells; pad once here so
+            # the per-cell loops below never need a bounds check
+            if len(row) < ncols:
+                row = row + [""] * (ncols - len(row))
+
             # per-column stats
-            for c in columns:
-                val = row.get(c, "")
-                # why are we using row.get?
-                # what does the second argument to get do?
-                # what if we just did val = row[c]?
-                val = "" if val is None else str(val)
-                # what is this line doing?
-
-                if is_missing(val):
-                    missing_counts[c] += 1
+            for i in range(ncols):
+                val = row[i]
+
+                # is_missing(val), inlined: this runs once per cell
+                if not val or val.isspace():
+                    missing_counts[i] += 1
                 else:
-                    non_missing_seen[c] += 1
-                    if numeric_possible[c] and not is_number(val.strip()):
-                        numeric_possible[c] = False
+                    non_missing_seen[i] += 1
+
+            # numeric inference, only where it can still succeed
+            # (is_number tolerates surrounding whitespace, like float())
+            failed = False
+            for i in active_numeric:
+                val = row[i]
+                if val and not val.isspace() and not is_number(val):
+                    numeric_possible[i] = 0
+                    failed = True
+
+            # rare: rebuild the list only on a row where a column dropped out
+            if failed:
+                active_numeric = [i for i in active_numeric if numeric_possible[i]]
 
+    return columns, row_count, missing_counts, non_missing_seen, numeric_possible, preview_rows
 
 
-                
+def scan_with_arrow(path: Path, delimiter: str, head: int):
+    """
+    Scan the whole file with pyarrow's streaming, multi-threaded CSV reader.
+
+    Every column is read as a string and "" as null, so missing values and
+    type inference follow the same rules as scan_with_csv; the per-cell work
+    runs vectorized in C. Values the RE2 regexes reject are re-checked with
+    is_number, so the inferred types match exactly.
+
+    Returns the same tuple as scan_with_csv, or None if pyarrow isn't
+    installed or can't parse the file (e.g. rows with a different number of
+    fields), in which case the caller falls back to the csv module.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:  # optional: the csv module path handles everything without it
+        return None
+
+    with path.open("r", encoding="utf-8", newline="") as f:
+        columns = read_header(csv.reader(f, delimiter=delimiter))
+    ncols = len(columns)
+    # positional names, so duplicate or blank headers can't collide
+    names = [str(i) for i in range(ncols)]
+
+    row_count = 0
+    preview_rows: list[list[str]] = []
+    missing_counts = array.array("q", [0] * ncols)
+    numeric_possible = bytearray(b"\x01" * ncols)
+    non_missing_seen = array.array("q", [0] * ncols)
+
+    # RE2 equivalents of NUMBER_RE / SPECIAL_NUMBER_RE, anchored
+    number_pattern = "^" + NUMBER_RE.pattern + "$"
+    special_pattern = "^" + SPECIAL_NUMBER_RE.pattern + "$"
+
+    try:
+        reader = pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={n: pa.string() for n in names},
+                strings_can_be_null=True,
+                null_values=[""],
+            ),
+        )
+        for batch in reader:
+            if len(preview_rows) < head:
+                for rec in batch.slice(0, head - len(preview_rows)).to_pylist():
+                    preview_rows.append(["" if rec[n] is None else rec[n] for n in names])
+
+            row_count += batch.num_rows
+            for i, col in enumerate(batch.columns):
+                # "" is null here; whitespace-only values are missing too
+                blank = pc.fill_null(pc.utf8_is_space(col), True)
+                miss = pc.sum(blank).as_py() or 0
+                missing_counts[i] += miss
+                non_missing_seen[i] += batch.num_rows - miss
+
+                if not numeric_possible[i]:
+                    continue
+                values = pc.filter(col, pc.invert(blank))
+                numeric = pc.or_(
+                    pc.match_substring_regex(values, number_pattern),
+                    pc.match_substring_regex(values, special_pattern, ignore_case=True),
+                )
+                rejected = pc.filter(values, pc.invert(numeric))
+                if any(not is_number(v) for v in rejected.to_pylist()):
+                    numeric_possible[i] = 0
+    except pa.ArrowInvalid:
+        return None
+
+    return columns, row_count, missing_counts, non_missing_seen, numeric_possible, preview_rows
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+
+    # ===== Step 1: Validate arguments =====
+    # TODO: validate args.head is >= 0
+    # If invalid, exit nicely like:
+    #   raise SystemExit("ERROR: --head must be >= 0")
+
+    if args.head < 0:
+        raise SystemExit("ERROR: --head must be >= 0")
+
+
+    # ===== Step 2: Validate file path =====
+    path = Path(args.csv_path)
+
+    # TODO: check file exists, else SystemExit with a helpful error
+    # TODO: check it's a file (not a folder), else SystemExit
+
+    if not path.exists():
+        raise SystemExit(f"ERROR: file not found: {path}")
+
+    if not path.is_file():
+        raise SystemExit(f"ERROR: not a file: {path}")
+
 
+    # ===== Step 3: Scan the file =====
+    if args.preview_only:
+        columns, preview_rows = read_preview(path, args.delimiter, args.head)
+        out = [f"File: {path}", f"Columns ({len(columns)}): {', '.join(columns)}", ""]
+        out.extend(format_preview(columns, preview_rows, args.head))
+        sys.stdout.write("\n".join(out) + "\n")
+        return
 
+    stats = None
+    if path.stat().st_size >= ARROW_MIN_BYTES:
+        stats = scan_with_arrow(path, args.delimiter, args.head)
+    if stats is None:
+        stats = scan_with_csv(path, args.delimiter, args.head)
 
+    columns, row_count, missing_counts, non_missing_seen, numeric_possible, preview_rows = stats
 
 
     # ===== Step 4: Print summary =====
@@ -136,34 +343,36 @@ def main(argv=None) -> None:
     #     - "numeric" if numeric_possible[col] is True
     #     - "text" otherwise
 
-    print(f"File: {path}")
-    print(f"Rows: {row_count}")
-    print(f"Columns ({len(columns)}): {', '.join(columns)}")
-    print()
+    # collect every output line and write them all at once at the end
+    out = []
+    out.append(f"File: {path}")
+    out.append(f"Rows: {row_count}")
+    out.append(f"Columns ({len(columns)}): {', '.join(columns)}")
+    out.append("")
 
-    print("Column summary:")
-    for c in columns:
-        miss = missing_counts[c]
+    out.append("Column summary:")
+    for i, c in enumerate(columns):
+        miss = missing_counts[i]
         miss_pct = (miss / row_count * 100) if row_count > 0 else 0.0
 
-        if non_missing_seen[c] == 0:
+        if non_missing_seen[i] == 0:
             col_type = "empty"
         else:
-            col_type = "numeric" if numeric_possible[c] else "text"
+            col_type = "numeric" if numeric_possible[i] else "text"
 
-        print(f"- {c}: type={col_type}, missing={miss} ({miss_pct:.1f}%)")
+        out.append(f"- {c}: type={col_type}, missing={miss} ({miss_pct:.1f}%)")
 
 
     # ===== Step 5: Print preview =====
     # Print the first N rows you captured.
-    # Keep it simple: print the row dicts. (Later you can format prettier.)
+    # Keep it simple: print the rows as dicts. (Later you can format prettier.)
 
     # NOTE: If row_count is 0, handle missing % without dividing by zero.
 
-    print()
-    print(f"Preview (first {min(args.head, len(preview_rows))} rows):")
-    for i, row in enumerate(preview_rows, start=1):
-        print(f"{i}. {row}")
+    out.append("")
+    out.extend(format_preview(columns, preview_rows, args.head))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":